@@ -3,6 +3,8 @@
 ##
 ## On native: uses FileAccess + modification times.
 ## On web: uses HTTPRequest to fetch live JSON from the dev server at /data/*.
+##   When the dev server's /watch change stream is connected, a poll only
+##   fetches after the server has reported a change.
 ##
 ## Supports two file formats:
 ##   1. Standalone puzzle files (same format as story puzzle steps)
@@ -40,6 +42,20 @@ var _chapter_loaded: bool = false
 var _http: HTTPRequest = null
 var _http_base_url: String = ""
 var _http_pending: bool = false
+var _push_changes_seen: int = -1  # Last /watch change count we fetched for
+
+## Opens an EventSource on the dev server's /watch stream. `open` is false
+## until connected (and after errors), so polling falls back to plain fetches.
+const _WATCH_STREAM_JS := """
+(function () {
+	if (window.wachesawWatch || typeof EventSource === "undefined") return;
+	var w = window.wachesawWatch = {open: false, changes: 0};
+	var es = new EventSource("/watch");
+	es.onopen = function () { w.open = true; w.changes++; };
+	es.onmessage = function () { w.changes++; };
+	es.onerror = function () { w.open = false; };
+})();
+"""
 
 # ─── Autostart ───────────────────────────────────────────────────
 
@@ -69,8 +85,11 @@ func watch_file(path: String) -> void:
 	_watch_path = path
 	_last_modified = 0
 	_last_content_hash = 0
+	_push_changes_seen = -1
 	_active = true
 	_poll_timer = 0.0
+	if _is_web:
+		JavaScriptBridge.eval(_WATCH_STREAM_JS, true)
 	print("[MapWatcher] Watching: %s" % path)
 	# Immediate first load
 	_check_and_reload()
@@ -187,6 +206,14 @@ func _check_and_reload_web() -> void:
 	if _http_pending:
 		return  # Still waiting for previous request
 
+	# With the /watch stream connected, skip the fetch until a change is pushed
+	var changes = JavaScriptBridge.eval(
+		"window.wachesawWatch && window.wachesawWatch.open ? window.wachesawWatch.changes : -1", true)
+	if changes != null and int(changes) >= 0:
+		if int(changes) == _push_changes_seen:
+			return
+		_push_changes_seen = int(changes)
+
 	# Convert res://data/... → /data/...
 	var url_path: String = _watch_path.replace("res://", "/")
 	var url: String = _http_base_url + url_path
@@ -200,6 +227,8 @@ func _check_and_reload_web() -> void:
 func _on_http_completed(result: int, code: int, headers: PackedStringArray, body: PackedByteArray) -> void:
 	_http_pending = false
 
+	if result != HTTPRequest.RESULT_SUCCESS or code != 200:
+		_push_changes_seen = -1  # Retry on the next poll, not the next change
 	if result != HTTPRequest.RESULT_SUCCESS:
 		push_warning("[MapWatcher] HTTP request error: result=%d" % result)
 		return
@@ -4,56 +4,282 @@ Wachesaw Dev Server — serves the web build + live data files for hot-reload.
 
 The web build's .pck contains a snapshot of data/ at build time, but this server
 also serves data/ files live from disk at /data/*, so the MapWatcher can poll
-for changes without rebuilding.
+for changes without rebuilding. /watch is a Server-Sent Events stream that
+announces each data file change, so the MapWatcher only has to fetch when
+something actually changed.
 
 When --watch is provided, the server injects a config script into index.html
-so the game auto-starts watching the specified file.
+so the game auto-starts watching the specified file. --quiet turns off the
+per-request log (errors are still printed).
 
 Usage:
-    python3 tools/dev_server.py [port] [--watch=story/chapter_1.json] [--puzzle=ch1_p03]
+    python3 tools/dev_server.py [port] [--watch=story/chapter_1.json] [--puzzle=ch1_p03] [--quiet]
 """
 
+import ctypes
 import http.server
 import json
+import mmap
 import os
+import queue
 import re
+import socket
+import stat
+import struct
 import sys
+import threading
 import time
 import email.utils
+import gzip
+from datetime import timezone
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs
 
 # Resolve project root (parent of tools/)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 WEB_BUILD = PROJECT_ROOT / "builds" / "web"
 DATA_DIR = PROJECT_ROOT / "data"
 
-# Parse args
+# Set from the command line by main()
 PORT = 8000
 WATCH_PATH = ""
 WATCH_PUZZLE = ""
+QUIET = False
 
-for arg in sys.argv[1:]:
-    if arg.startswith("--watch="):
-        WATCH_PATH = arg[len("--watch="):]
-    elif arg.startswith("--puzzle="):
-        WATCH_PUZZLE = arg[len("--puzzle="):]
-    elif arg.isdigit():
-        PORT = int(arg)
+# Injected into index.html; kept as bytes so it splices into the cached page as-is
+_CONFIG_SCRIPT_BYTES = b""
 
 
-def _build_config_script() -> str:
+def _parse_args(argv: list[str]) -> tuple[int, str, str, bool]:
+    """Return (port, watch path, puzzle id, quiet) from the command-line arguments."""
+    port, watch, puzzle, quiet = PORT, "", "", False
+    for arg in argv:
+        if arg.startswith("--watch="):
+            watch = arg[len("--watch="):]
+        elif arg.startswith("--puzzle="):
+            puzzle = arg[len("--puzzle="):]
+        elif arg == "--quiet":
+            quiet = True
+        elif arg.isdigit():
+            port = int(arg)
+    return port, watch, puzzle, quiet
+
+
+def _build_config_script(watch: str, puzzle: str) -> str:
     """Build a <script> tag that sets window.WACHESAW_WATCH before the engine loads."""
-    if not WATCH_PATH:
+    if not watch:
         return ""
-    config = {"watch": WATCH_PATH}
-    if WATCH_PUZZLE:
-        config["puzzle"] = WATCH_PUZZLE
+    config = {"watch": watch}
+    if puzzle:
+        config["puzzle"] = puzzle
     return f'<script>window.WACHESAW_WATCH={json.dumps(config)};</script>\n'
 
 
-# Cache the patched index.html (rebuilt on each request to stay current)
-_CONFIG_SCRIPT = _build_config_script()
+# Patched index.html bytes, rebuilt only when the source file's mtime/size change
+_INDEX_CACHE = {"mtime": -1, "size": -1, "body": b"", "length": "0"}
+_INDEX_LOCK = threading.Lock()
+
+# String form of the data root, resolved once — the hot path joins plain
+# strings instead of building Path objects per request.
+_DATA_DIR_STR = str(DATA_DIR.resolve()) + os.sep
+
+# Whitelist for the part of a /data/* URL after "data/": slash-separated
+# segments of [A-Za-z0-9_.-], none of them "." or "..". Anything matching can't
+# leave DATA_DIR, so the realpath() walk is unnecessary.
+_SAFE_REL = re.compile(rb"\A(?!\.{1,2}(?:/|\Z))[\w.\-]+(?:/(?!\.{1,2}(?:/|\Z))[\w.\-]+)*\Z")
+
+# url_path → (file path under DATA_DIR, stat result, expiry). MapWatcher polls
+# the same file several times a second, so a short TTL collapses the path
+# check and stat() of back-to-back polls into one. Entries are replaced whole,
+# so plain dict get/set is safe across handler threads.
+_STAT_TTL = 0.2  # seconds
+_STAT_CACHE: dict[str, tuple[str, os.stat_result, float]] = {}
+
+# Without os.sendfile, files above this size are mmap'd and written from the
+# page cache rather than copied into a fresh bytes object first.
+_MMAP_THRESHOLD = 64 * 1024
+
+# Data files above this size are sent gzip'd to clients that accept it. The
+# compressed bytes are kept per path, keyed by the file's ETag, so a file is
+# compressed once per change however often it is polled.
+_GZIP_MIN_SIZE = 1024
+_GZIP_CACHE: dict[str, tuple[bytes, str]] = {}
+
+
+# Response header lines that never change, encoded once at import instead of
+# being %-formatted and latin-1 encoded by send_header() on every response.
+_STATUS_LINES = {
+    code: f"{http.server.BaseHTTPRequestHandler.protocol_version} {code} "
+          f"{http.HTTPStatus(code).phrase}\r\n".encode("latin-1")
+    for code in (200, 304)
+}
+_HDR_SERVER = (
+    f"Server: {http.server.SimpleHTTPRequestHandler.server_version} "
+    f"{http.server.SimpleHTTPRequestHandler.sys_version}\r\n"
+).encode("latin-1")
+_HDR_JSON = b"Content-Type: application/json\r\n"
+_HDR_VARY = b"Vary: Accept-Encoding\r\n"
+_HDR_GZIP = b"Content-Encoding: gzip\r\n"
+_HDR_DATA = _HDR_JSON + _HDR_VARY
+_HDR_DATA_GZIP = _HDR_DATA + _HDR_GZIP
+_HDR_HTML = b"Content-Type: text/html; charset=utf-8\r\n"
+_HDR_EVENT_STREAM = b"Content-Type: text/event-stream\r\n"
+_HDR_NOCACHE = b"Cache-Control: no-cache, no-store, must-revalidate\r\n"
+# Responses carrying an ETag may be stored but must be revalidated on every
+# use — the browser then polls with If-None-Match and gets cheap 304s.
+_HDR_REVALIDATE = b"Cache-Control: no-cache\r\n"
+_ANSI_CYAN = b"\033[36m"
+_ANSI_RESET = b"\033[0m\n"
+
+_HDR_ISOLATION = (
+    b"Cross-Origin-Opener-Policy: same-origin\r\n"
+    b"Cross-Origin-Embedder-Policy: require-corp\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+)
+
+
+def _etag(st: os.stat_result) -> str:
+    """Strong validator for a data file: changes whenever mtime or size does."""
+    return f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def _get_gzip(path: str, f, etag: str) -> bytes:
+    """Return gzip'd contents of the open file `f`, recompressing only when `etag` changes."""
+    cached = _GZIP_CACHE.get(path)
+    if cached is not None and cached[1] == etag:
+        return cached[0]
+    f.seek(0)
+    data = gzip.compress(f.read(), compresslevel=6)
+    _GZIP_CACHE[path] = (data, etag)
+    return data
+
+
+def _warm_gzip_cache():
+    """Precompress every large data file so the first poll of each is already cheap."""
+    for dirpath, _dirnames, filenames in os.walk(_DATA_DIR_STR):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            rel = os.path.relpath(path, _DATA_DIR_STR).replace(os.sep, "/")
+            # Same key the request handler builds from the URL
+            key = os.path.join(_DATA_DIR_STR, rel)
+            try:
+                with open(path, "rb") as f:
+                    st = os.fstat(f.fileno())
+                    if st.st_size > _GZIP_MIN_SIZE:
+                        _get_gzip(key, f, _etag(st))
+            except OSError:
+                pass
+
+
+# ── Change stream (/watch) ──────────────────────────────────────────────────
+
+# One queue of pending SSE messages per connected /watch client
+_WATCHERS: set[queue.Queue] = set()
+_WATCHERS_LOCK = threading.Lock()
+_WATCH_KEEPALIVE = 15.0  # seconds between comments on an idle stream
+_WATCH_SCAN_INTERVAL = 0.5  # seconds, mtime-scan fallback where inotify is missing
+
+# <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_ISDIR = 0x40000000
+_IN_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_IN_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (name follows)
+
+
+def _publish_change(rel: str, mtime: float):
+    """Tell every /watch client that data/<rel> changed."""
+    # The stat cache would otherwise keep answering 304 for up to _STAT_TTL
+    _STAT_CACHE.pop("/data/" + rel, None)
+    msg = f"data: {json.dumps({'changed': rel, 'mtime': mtime})}\n\n".encode("utf-8")
+    with _WATCHERS_LOCK:
+        for events in _WATCHERS:
+            events.put(msg)
+
+
+def _file_mtime(path: str) -> float:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0.0  # deleted
+
+
+def _inotify_init() -> tuple[int, ctypes.CDLL] | None:
+    """Open an inotify fd via libc, or None where inotify isn't available."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    return (fd, libc) if fd >= 0 else None
+
+
+def _watch_thread():
+    """Feed _publish_change from inotify on DATA_DIR (Linux) or an mtime scan."""
+    inotify = _inotify_init()
+    if inotify is None:
+        _scan_for_changes()
+        return
+
+    fd, libc = inotify
+    wd_dirs: dict[int, str] = {}  # watch descriptor → dir relative to data/ ("" = root)
+
+    def add_watch(rel_dir: str):
+        path = os.path.join(_DATA_DIR_STR, rel_dir)
+        wd = libc.inotify_add_watch(fd, os.fsencode(path), _IN_MASK)
+        if wd >= 0:
+            wd_dirs[wd] = rel_dir
+
+    # inotify isn't recursive — watch every directory, and new ones as they appear
+    for dirpath, _dirnames, _filenames in os.walk(_DATA_DIR_STR):
+        rel_dir = os.path.relpath(dirpath, _DATA_DIR_STR)
+        add_watch("" if rel_dir == "." else rel_dir.replace(os.sep, "/"))
+
+    while True:
+        buf = os.read(fd, 64 * 1024)
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _cookie, name_len = _IN_EVENT.unpack_from(buf, offset)
+            offset += _IN_EVENT.size
+            name = os.fsdecode(buf[offset:offset + name_len].rstrip(b"\0"))
+            offset += name_len
+            rel_dir = wd_dirs.get(wd)
+            if rel_dir is None or not name:
+                continue
+            rel = f"{rel_dir}/{name}" if rel_dir else name
+            if mask & _IN_ISDIR:
+                if mask & _IN_CREATE:
+                    add_watch(rel)
+            elif mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_DELETE):
+                _publish_change(rel, _file_mtime(os.path.join(_DATA_DIR_STR, rel)))
+
+
+def _scan_for_changes():
+    """Portable fallback: diff data/ mtimes every _WATCH_SCAN_INTERVAL."""
+    def snapshot() -> dict[str, int]:
+        seen = {}
+        for dirpath, _dirnames, filenames in os.walk(_DATA_DIR_STR):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                rel = os.path.relpath(path, _DATA_DIR_STR).replace(os.sep, "/")
+                try:
+                    seen[rel] = os.stat(path).st_mtime_ns
+                except OSError:
+                    pass
+        return seen
+
+    previous = snapshot()
+    while True:
+        time.sleep(_WATCH_SCAN_INTERVAL)
+        current = snapshot()
+        for rel in current.keys() | previous.keys():
+            if current.get(rel) != previous.get(rel):
+                mtime_ns = current.get(rel)
+                _publish_change(rel, mtime_ns / 1e9 if mtime_ns is not None else 0.0)
+        previous = current
 
 
 class DevHandler(http.server.SimpleHTTPRequestHandler):
@@ -63,101 +289,356 @@ class DevHandler(http.server.SimpleHTTPRequestHandler):
         super().__init__(*args, directory=str(WEB_BUILD), **kwargs)
 
     def do_GET(self):
-        parsed = urlparse(self.path)
+        # Only the path is routed on, so skip urlparse() and just drop the query
+        path = self.path
+        query_start = path.find("?")
+        if query_start >= 0:
+            path = path[:query_start]
 
         # /data/* → serve live from project data/ directory
-        if parsed.path.startswith("/data/"):
-            self._serve_data_file(parsed.path)
+        if path.startswith("/data/"):
+            self._serve_data_file(path)
+            return
+
+        # /watch → stream data file change notifications
+        if path == "/watch":
+            self._serve_watch_stream()
             return
 
         # index.html (or /) → inject watch config script
-        if _CONFIG_SCRIPT and parsed.path in ("/", "/index.html"):
+        if _CONFIG_SCRIPT_BYTES and path in ("/", "/index.html"):
             self._serve_patched_index()
             return
 
         # Everything else → serve from builds/web/
         super().do_GET()
 
+    def _serve_watch_stream(self):
+        """Server-Sent Events: one message per data file change until the client leaves."""
+        events: queue.Queue = queue.Queue()
+        with _WATCHERS_LOCK:
+            _WATCHERS.add(events)
+        try:
+            self._write_fixed_headers(200, _HDR_EVENT_STREAM)
+            while True:
+                try:
+                    msg = events.get(timeout=_WATCH_KEEPALIVE)
+                except queue.Empty:
+                    # Comment line — keeps proxies from timing out and notices
+                    # a client that went away without closing
+                    msg = b": keep-alive\n\n"
+                self.wfile.write(msg)
+        except OSError:
+            pass  # client disconnected
+        finally:
+            with _WATCHERS_LOCK:
+                _WATCHERS.discard(events)
+            self.close_connection = True
+
     def _serve_patched_index(self):
         """Serve index.html with watch config injected before </head>."""
         index_path = WEB_BUILD / "index.html"
-        if not index_path.is_file():
+        try:
+            st = index_path.stat()
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             self.send_error(404, "index.html not found")
             return
 
-        html = index_path.read_text()
-        # Inject config script right before </head>
-        html = html.replace("</head>", _CONFIG_SCRIPT + "</head>", 1)
-        content = html.encode("utf-8")
-
-        self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(content)))
-        self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
-        self.end_headers()
-        self.wfile.write(content)
+        with _INDEX_LOCK:
+            if st.st_mtime_ns != _INDEX_CACHE["mtime"] or st.st_size != _INDEX_CACHE["size"]:
+                try:
+                    src = index_path.read_bytes()
+                except OSError as e:
+                    self.send_error(500, str(e))
+                    return
+                # Inject config script right before </head>, spliced in as bytes
+                head_end = src.find(b"</head>")
+                if head_end >= 0:
+                    content = src[:head_end] + _CONFIG_SCRIPT_BYTES + src[head_end:]
+                else:
+                    content = src
+                _INDEX_CACHE.update(
+                    mtime=st.st_mtime_ns, size=st.st_size,
+                    body=content, length=str(len(content)),
+                )
+            body, length = _INDEX_CACHE["body"], _INDEX_CACHE["length"]
+
+        self._write_fixed_headers(200, _HDR_HTML, length, st.st_mtime, body=body)
 
     def _serve_data_file(self, url_path: str):
         # Map /data/story/chapter_1.json → PROJECT_ROOT/data/story/chapter_1.json
         rel_path = url_path.lstrip("/")
-        file_path = PROJECT_ROOT / rel_path
 
-        # Security: prevent path traversal
-        try:
-            file_path = file_path.resolve()
-            if not str(file_path).startswith(str(DATA_DIR.resolve())):
+        now = time.monotonic()
+        cached = _STAT_CACHE.get(url_path)
+        if cached is not None and now < cached[2]:
+            file_path, st, _ = cached
+        else:
+            # Security: prevent path traversal
+            data_rel = rel_path[len("data/"):]
+            if not _SAFE_REL.match(data_rel.encode()):
                 self.send_error(403, "Forbidden")
                 return
-        except (ValueError, OSError):
-            self.send_error(400, "Bad path")
-            return
-
-        if not file_path.is_file():
-            self.send_error(404, f"Not found: {rel_path}")
+            file_path = os.path.join(_DATA_DIR_STR, data_rel)
+
+            # One stat serves as both the existence check and the metadata
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
+                self.send_error(404, f"Not found: {rel_path}")
+                return
+            _STAT_CACHE[url_path] = (file_path, st, now + _STAT_TTL)
+
+        # Unchanged since the client's last poll → headers only, no file read
+        accepts_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+        etag = _etag(st)
+        if self._not_modified(etag, st.st_mtime):
+            # Repeat the validator the 200 would carry (RFC 9110 §15.4.5)
+            if st.st_size > _GZIP_MIN_SIZE and accepts_gzip:
+                etag = "W/" + etag
+            self._write_fixed_headers(304, _HDR_VARY, etag=etag)
             return
 
         try:
-            content = file_path.read_bytes()
+            f = open(file_path, "rb")
         except OSError as e:
             self.send_error(500, str(e))
             return
 
-        # Send with modification time so the client can detect changes
-        mtime = file_path.stat().st_mtime
-        last_modified = email.utils.formatdate(mtime, usegmt=True)
+        with f:
+            # The cached stat can be up to _STAT_TTL old — describe the body
+            # by what was actually opened so a fresh save is never mislabelled.
+            st = os.fstat(f.fileno())
+            etag = _etag(st)
+
+            # Large file + gzip-capable client → precompressed body. The ETag
+            # is weakened since the bytes differ from the identity encoding.
+            if st.st_size > _GZIP_MIN_SIZE and accepts_gzip:
+                try:
+                    body = _get_gzip(file_path, f, etag)
+                except OSError as e:
+                    self.send_error(500, str(e))
+                    return
+                self._write_fixed_headers(
+                    200, _HDR_DATA_GZIP, str(len(body)), st.st_mtime, "W/" + etag, body=body,
+                )
+                return
 
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(content)))
-        self.send_header("Last-Modified", last_modified)
-        self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
-        self.end_headers()
-        self.wfile.write(content)
+            # No zero-copy path (e.g. Windows) → write from memory
+            if not hasattr(os, "sendfile"):
+                self._write_file_from_memory(f, st, etag)
+                return
+
+            # Headers leave in one write, then the body goes kernel-side.
+            # Send with modification time so the client can detect changes.
+            # Corked (Linux), so the two go out in full segments, not a
+            # header-only packet followed by the body.
+            self._cork(True)
+            try:
+                self._write_fixed_headers(200, _HDR_DATA, str(st.st_size), st.st_mtime, etag)
+                self._sendfile(f, st.st_size)
+            finally:
+                self._cork(False)
+
+    def _cork(self, on: bool):
+        if hasattr(socket, "TCP_CORK"):
+            try:
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, int(on))
+            except OSError:
+                pass
+
+    def _not_modified(self, etag: str, mtime: float) -> bool:
+        """True if the request's validators show the client already has this version."""
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110 §13.2.2)
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            # Weak comparison, so the W/ tag of a gzip'd body matches too
+            tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+            return "*" in tags or etag in tags
+
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if not if_modified_since:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # Last-Modified has 1s resolution, so compare whole seconds
+        return int(mtime) <= since.timestamp()
+
+    def _write_fixed_headers(
+        self,
+        status: int,
+        fixed_headers: bytes = b"",
+        content_length: str = "",
+        last_modified: float | None = None,
+        etag: str = "",
+        body: bytes | mmap.mmap = b"",
+    ):
+        """Write the status line, headers and optional body in one gathered send.
+
+        Bypasses send_response()/send_header(): the fixed lines are the
+        pre-encoded _HDR_* constants (`fixed_headers` carries the ones specific
+        to this response), only the per-response values are formatted.
+        """
+        self.log_request(status)
+        if self.request_version == "HTTP/0.9":
+            self.wfile.write(body)
+            return
+        parts = [
+            _STATUS_LINES[status],
+            _HDR_SERVER,
+            b"Date: ", self.date_time_string().encode("latin-1"), b"\r\n",
+            fixed_headers,
+        ]
+        if content_length:
+            parts += (b"Content-Length: ", content_length.encode("latin-1"), b"\r\n")
+        if last_modified is not None:
+            last_modified_str = email.utils.formatdate(last_modified, usegmt=True)
+            parts += (b"Last-Modified: ", last_modified_str.encode("latin-1"), b"\r\n")
+        if etag:
+            parts += (b"ETag: ", etag.encode("latin-1"), b"\r\n", _HDR_REVALIDATE)
+        else:
+            parts.append(_HDR_NOCACHE)
+        parts += (_HDR_ISOLATION, b"\r\n")
+        self._send_all([b"".join(parts), body])
+
+    def _write_file_from_memory(self, f, st: os.stat_result, etag: str):
+        """Fallback body path: mmap large files, read small ones."""
+        if st.st_size > _MMAP_THRESHOLD:
+            try:
+                mm = mmap.mmap(f.fileno(), st.st_size, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mm = None
+            if mm is not None:
+                with mm:
+                    self._write_fixed_headers(
+                        200, _HDR_DATA, str(st.st_size), st.st_mtime, etag, body=mm,
+                    )
+                return
+
+        try:
+            content = f.read()
+        except OSError as e:
+            self.send_error(500, str(e))
+            return
+        self._write_fixed_headers(
+            200, _HDR_DATA, str(len(content)), st.st_mtime, etag, body=content,
+        )
+
+    def _sendfile(self, f, size: int):
+        """Copy `size` bytes of `f` straight to the socket (kernel-side, no userspace copy)."""
+        out_fd = self.wfile.fileno()
+        in_fd = f.fileno()
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+            if sent == 0:
+                # File shrank underneath us (e.g. truncated mid-save) — the
+                # Content-Length is now wrong, so drop the connection.
+                self.close_connection = True
+                break
+            offset += sent
+
+    def copyfile(self, source, outputfile):
+        # Static build assets (.wasm/.pck run to several MB) go straight from
+        # the page cache to the socket; socket.sendfile() falls back to plain
+        # send() on platforms without os.sendfile.
+        if outputfile is self.wfile:
+            self.connection.sendfile(source)
+        else:
+            super().copyfile(source, outputfile)
 
     def end_headers(self):
         # Cross-Origin-Isolation headers (required for SharedArrayBuffer/threads)
-        self.send_header("Cross-Origin-Opener-Policy", "same-origin")
-        self.send_header("Cross-Origin-Embedder-Policy", "require-corp")
-        self.send_header("Access-Control-Allow-Origin", "*")
+        self._raw_header(_HDR_ISOLATION)
         super().end_headers()
 
+    def _raw_header(self, kv: bytes):
+        """Queue pre-encoded header line(s), skipping send_header()'s formatting."""
+        if self.request_version != "HTTP/0.9":
+            if not hasattr(self, "_headers_buffer"):
+                self._headers_buffer = []
+            self._headers_buffer.append(kv)
+
+    def _send_all(self, buffers: list[bytes | memoryview | mmap.mmap]):
+        """Write every buffer to the socket, as few syscalls as the kernel allows."""
+        sock = self.connection
+        if not hasattr(sock, "sendmsg"):  # Windows
+            for buf in buffers:
+                self.wfile.write(buf)
+            return
+        views = [memoryview(buf) for buf in buffers]
+        while views:
+            sent = sock.sendmsg(views)
+            # Drop fully-sent buffers, trim a partially-sent one
+            while views and sent >= len(views[0]):
+                sent -= len(views[0])
+                views.pop(0)
+            if views:
+                views[0] = views[0][sent:]
+
+    # (whole second, formatted timestamp), shared by all handler threads
+    _log_date = (0, "")
+
+    def log_date_time_string(self):
+        now = int(time.time())
+        second, formatted = DevHandler._log_date
+        if second != now:
+            formatted = super().log_date_time_string()
+            DevHandler._log_date = (now, formatted)
+        return formatted
+
+    def log_request(self, code="-", size="-"):
+        if not QUIET:
+            super().log_request(code, size)
+
     def log_message(self, format, *args):
-        # Color-code data file requests for visibility
         msg = format % args
+        line = f"{self.log_date_time_string()} {msg}".encode("utf-8", "backslashreplace")
+        # Color-code data file requests for visibility
         if "/data/" in msg:
-            sys.stderr.write(f"\033[36m{self.log_date_time_string()} {msg}\033[0m\n")
+            line = _ANSI_CYAN + line + _ANSI_RESET
         else:
-            sys.stderr.write(f"{self.log_date_time_string()} {msg}\n")
+            line += b"\n"
+        # Bytes straight to the binary layer, skipping the text codec
+        out = sys.stderr.buffer
+        out.write(line)
+        out.flush()
+
+
+class DevServer(http.server.ThreadingHTTPServer):
+    """One thread per connection, so a slow /data/* poll never stalls asset fetches."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def finish_request(self, request, client_address):
+        # Small responses (304s, JSON polls) shouldn't wait on Nagle's algorithm
+        try:
+            request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+        super().finish_request(request, client_address)
 
 
 def main():
+    global PORT, WATCH_PATH, WATCH_PUZZLE, QUIET, _CONFIG_SCRIPT_BYTES
+    PORT, WATCH_PATH, WATCH_PUZZLE, QUIET = _parse_args(sys.argv[1:])
+    _CONFIG_SCRIPT_BYTES = _build_config_script(WATCH_PATH, WATCH_PUZZLE).encode("utf-8")
+
     if not WEB_BUILD.exists():
         print(f"Error: Web build not found at {WEB_BUILD}")
         print("Run 'just build-web-debug' first.")
         sys.exit(1)
 
     # Get LAN IP for convenience
-    import socket
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))
@@ -166,7 +647,7 @@ def main():
     except Exception:
         lan_ip = "localhost"
 
-    server = http.server.HTTPServer(("0.0.0.0", PORT), DevHandler)
+    server = DevServer(("0.0.0.0", PORT), DevHandler)
 
     print(f"╔══════════════════════════════════════════════════╗")
     print(f"║  Wachesaw Dev Server                            ║")
@@ -184,6 +665,10 @@ def main():
     print(f"╚══════════════════════════════════════════════════╝")
     print()
 
+    # Compress large data files in the background; requests don't wait on it
+    threading.Thread(target=_warm_gzip_cache, daemon=True).start()
+    threading.Thread(target=_watch_thread, daemon=True).start()
+
     try:
         server.serve_forever()
     except KeyboardInterrupt:
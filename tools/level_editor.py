@@ -19,21 +19,102 @@ Dependencies (macOS via Homebrew):
     brew install gtk4 pygobject3 gobject-introspection adwaita-icon-theme
     brew install --cask godot       (for native Play mode)
     # Or run: just mac-setup
+
+Optional:
+    pip install orjson              (faster chapter load/save)
+    pip install pyobjc-framework-Cocoa   (macOS: focus Godot without osascript)
 """
 
+import functools
 import os
+import shutil
 import signal
+import socket
+import stat
 import subprocess
 import sys
-import copy
 import json
 import webbrowser
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, NamedTuple
+
+# ── Command line ───────────────────────────────────────────────────────────────
+# Parsed before GTK is imported, so a bad --native invocation fails without
+# loading the GTK libraries first
+
+# Prefixes of the flags main() handles itself; anything else goes to GTK
+_CUSTOM_FLAGS = ("--native", "--godot-path=")
+
+
+class _Args(NamedTuple):
+    native_mode: bool
+    godot_path: str
+    initial_file: str | None
+    gtk_args: list[str]
+
+
+@functools.lru_cache(maxsize=1)
+def _find_godot_binary() -> str:
+    """Try to locate the Godot 4.4 binary on macOS."""
+    candidates = [
+        "/Applications/Godot_v4.4.app/Contents/MacOS/Godot",
+        "/Applications/Godot.app/Contents/MacOS/Godot",
+    ]
+    for path in candidates:
+        # One stat for both "is a regular file" and "is executable"
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode) and st.st_mode & stat.S_IXUSR:
+            return path
+    # Fall back to PATH lookup
+    found = shutil.which("godot")
+    return found or ""
+
+
+def _parse_args(argv: list[str]) -> _Args:
+    native_mode = False
+    godot_path = ""
+    initial_file = None
+
+    # One pass over argv: take our custom flags and the optional chapter path
+    # (the first non-flag argument), pass everything else through to GTK
+    gtk_args = [argv[0]]
+    for a in argv[1:]:
+        if a.startswith(_CUSTOM_FLAGS):
+            if a == "--native":
+                native_mode = True
+            elif a.startswith("--godot-path="):
+                godot_path = a[len("--godot-path="):]
+            else:  # only shares a prefix with ours, e.g. --native-foo
+                gtk_args.append(a)
+        elif a[:1] != "-" and initial_file is None:
+            initial_file = str(Path(a).resolve())
+        else:
+            gtk_args.append(a)
+
+    # Auto-detect godot binary if --native but no --godot-path
+    if native_mode and not godot_path:
+        godot_path = _find_godot_binary()
+        if not godot_path:
+            print("Error: --native requires Godot. Install with: brew install --cask godot")
+            print("Or pass --godot-path=/path/to/godot")
+            sys.exit(1)
+
+    return _Args(native_mode, godot_path, initial_file, gtk_args)
+
+
+_ARGS: _Args | None = None
+if __name__ == "__main__":
+    _ARGS = _parse_args(sys.argv)
+
 
 try:
     import gi
     gi.require_version("Gtk", "4.0")
-    from gi.repository import Gtk, Gio, GLib, Gdk, Pango
+    from gi.repository import Gtk, Gio, GLib, GObject, Gdk, Pango
 except (ImportError, ValueError) as _err:
     print(f"Error: GTK4 Python bindings not available: {_err}")
     if sys.platform == "darwin":
@@ -44,6 +125,18 @@ except (ImportError, ValueError) as _err:
         print("Install with:  sudo apt-get install python3-gi gir1.2-gtk-4.0")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+NSRunningApplication = None
+if sys.platform == "darwin":
+    try:
+        from AppKit import NSRunningApplication, NSApplicationActivateIgnoringOtherApps
+    except ImportError:
+        pass
+
 # ── Constants ──────────────────────────────────────────────────────────────────
 
 PROJECT_DIR = Path(__file__).resolve().parent.parent
@@ -54,6 +147,10 @@ PLAYERS = ["white", "black"]
 WIN_CONDITIONS = ["capture_chief", "cross_piece"]
 BOARD_SIZE = 5
 
+# value → DropDown position
+_PLAYER_IDX = {p: i for i, p in enumerate(PLAYERS)}
+_WIN_IDX = {w: i for i, w in enumerate(WIN_CONDITIONS)}
+
 # Unicode chess symbols (white = outline, black = filled)
 PIECE_SYMBOLS = {
     "white": {
@@ -81,24 +178,111 @@ PIECE_LABELS = {
 }
 
 
-def piece_symbol(cell) -> str:
+class Cell(NamedTuple):
+    """An occupied board square; the JSON form is {"type": ..., "player": ...}."""
+    type: str
+    player: str
+
+
+def piece_symbol(cell: Cell | None) -> str:
     if cell is None:
         return ""
-    return PIECE_SYMBOLS.get(cell["player"], {}).get(cell["type"], "?")
+    return PIECE_SYMBOLS.get(cell.player, {}).get(cell.type, "?")
 
 
-def piece_tooltip(cell) -> str:
+def piece_tooltip(cell: Cell | None) -> str:
     if cell is None:
         return "Empty — click to place a piece"
-    player = cell["player"].capitalize()
-    label = PIECE_LABELS.get(cell["type"], cell["type"])
+    player = cell.player.capitalize()
+    label = PIECE_LABELS.get(cell.type, cell.type)
     return f"{player} {label} — click to change"
 
 
+# Cell → (symbol, tooltip) for every known piece, built once at import
+_PIECE_CACHE = {
+    cell: (piece_symbol(cell), piece_tooltip(cell))
+    for cell in (Cell(ptype, player) for player in PLAYERS for ptype in PIECE_TYPES)
+}
+_EMPTY = (piece_symbol(None), piece_tooltip(None))
+
+# symbol → cell label markup; "" is the empty-cell placeholder
+_MARKUP = {
+    sym: f'<span font="40">{sym}</span>'
+    for symbols in PIECE_SYMBOLS.values()
+    for sym in symbols.values()
+}
+_MARKUP[""] = '<span font="18" alpha="50%">-</span>'
+
+# Cell → (markup, tooltip): everything a board button shows
+_CELL_VIEWS = {key: (_MARKUP[sym], tooltip) for key, (sym, tooltip) in _PIECE_CACHE.items()}
+_EMPTY_VIEW = (_MARKUP[_EMPTY[0]], _EMPTY[1])
+
+
+def _cell_view(cell: Cell | None) -> tuple[str, str]:
+    if cell is None:
+        return _EMPTY_VIEW
+    view = _CELL_VIEWS.get(cell)
+    if view is None:  # unknown piece from a hand-edited file
+        view = (f'<span font="40">{piece_symbol(cell)}</span>', piece_tooltip(cell))
+    return view
+
+
 def empty_board():
     return [[None] * BOARD_SIZE for _ in range(BOARD_SIZE)]
 
 
+# Read-only stand-in for a step without a board
+_EMPTY_BOARD = tuple((None,) * BOARD_SIZE for _ in range(BOARD_SIZE))
+
+
+def board_from_json(board) -> list[list[Cell | None]]:
+    return [[Cell(c["type"], c["player"]) if c is not None else None for c in row]
+            for row in board]
+
+
+def board_to_json(board) -> list[list[dict | None]]:
+    return [[{"type": c.type, "player": c.player} if c is not None else None for c in row]
+            for row in board]
+
+
+def _json_loads(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Chapter file bytes: 2-space indent, trailing newline, UTF-8.
+
+    The json fallback writes non-ASCII unescaped so that both paths produce
+    byte-identical files.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _write_atomic(path: Path, data: bytes) -> os.stat_result:
+    """Replace `path` with `data` via a temp file, so readers never see half a file."""
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        # Don't leave a stray .tmp in data/ for the dev server to publish
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return os.stat(path)
+
+
 # ── CSS ────────────────────────────────────────────────────────────────────────
 
 EDITOR_CSS = b"""
@@ -111,6 +295,10 @@ EDITOR_CSS = b"""
 .piece-white      { color: #222222; }
 .piece-black      { color: #222222; }
 .step-row         { padding: 4px 8px; }
+
+/* Flat styling: transitions and shadows are costly on software renderers */
+*                 { transition: none; }
+.board-cell, button.board-cell { box-shadow: none; }
 """
 
 
@@ -158,7 +346,7 @@ class CellPopover(Gtk.Popover):
                 btn.set_tooltip_text(f"{player.capitalize()} {PIECE_LABELS[ptype]}")
                 btn.connect(
                     "clicked",
-                    lambda _b, pt=ptype, pl=player: self._pick({"type": pt, "player": pl}),
+                    lambda _b, pt=ptype, pl=player: self._pick(Cell(pt, pl)),
                 )
                 grid.attach(btn, col + 1, row + 1, 1, 1)
 
@@ -176,7 +364,14 @@ class BoardGrid(Gtk.Box):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         self._on_change = on_change
         self._board = empty_board()
-        self._buttons: dict[tuple[int, int], Gtk.Button] = {}
+        # (row, col) → bound (label.set_markup, button.set_tooltip_text), looked
+        # up once here instead of through the GI wrappers on every refresh
+        self._buttons: dict[tuple[int, int], tuple[Callable, Callable]] = {}
+        # (row, col) → (markup, tooltip) last pushed to that button
+        self._shown: dict[tuple[int, int], tuple[str, str]] = {}
+        # One popover, moved to whichever cell was clicked
+        self._popover = CellPopover(self._on_piece_picked)
+        self._pending_place: tuple[int, int] | None = None
 
         grid = Gtk.Grid()
         grid.set_row_homogeneous(True)
@@ -207,56 +402,141 @@ class BoardGrid(Gtk.Box):
                 else:
                     btn.add_css_class("board-cell-dark")
                 btn.connect("clicked", self._on_cell_clicked, row, col)
-                self._buttons[(row, col)] = btn
+                cell_lbl = Gtk.Label()
+                btn.set_child(cell_lbl)
+                self._buttons[(row, col)] = (cell_lbl.set_markup, btn.set_tooltip_text)
                 grid.attach(btn, col + 1, row + 1, 1, 1)
 
         self._refresh()
 
     def set_board(self, board):
-        self._board = copy.deepcopy(board) if board else empty_board()
+        self._board = board_from_json(board or _EMPTY_BOARD)
         self._refresh()
 
     def get_board(self):
-        return copy.deepcopy(self._board)
+        return board_to_json(self._board)
 
     def _refresh(self):
-        for (row, col), btn in self._buttons.items():
-            cell = self._board[row][col]
-            sym = piece_symbol(cell)
-
-            child = btn.get_child()
-            if not isinstance(child, Gtk.Label):
-                child = Gtk.Label()
-                btn.set_child(child)
-
-            if sym:
-                child.set_markup(f'<span font="40">{sym}</span>')
-            else:
-                child.set_markup('<span font="18" alpha="50%">-</span>')
-
-            btn.set_tooltip_text(piece_tooltip(cell))
+        # Runs over all 25 cells on every set_board(), so keep lookups local
+        board = self._board
+        shown = self._shown
+        cell_view = _cell_view
+        for pos, (set_markup, set_tooltip) in self._buttons.items():
+            view = cell_view(board[pos[0]][pos[1]])
+            if shown.get(pos) != view:
+                shown[pos] = view
+                set_markup(view[0])
+                set_tooltip(view[1])
+
+    def _refresh_cell(self, row, col):
+        pos = (row, col)
+        view = _cell_view(self._board[row][col])
+        if self._shown.get(pos) == view:
+            return
+        self._shown[pos] = view
+        set_markup, set_tooltip = self._buttons[pos]
+        set_markup(view[0])
+        set_tooltip(view[1])
 
     def _on_cell_clicked(self, btn, row, col):
-        popover = CellPopover(lambda piece: self._place(row, col, piece))
-        popover.set_parent(btn)
-        popover.popup()
+        self._pending_place = (row, col)
+        if self._popover.get_parent() is not btn:
+            if self._popover.get_parent() is not None:
+                self._popover.unparent()
+            self._popover.set_parent(btn)
+        self._popover.popup()
+
+    def _on_piece_picked(self, piece):
+        if self._pending_place is None:
+            return
+        row, col = self._pending_place
+        self._pending_place = None
+        self._place(row, col, piece)
 
     def _place(self, row, col, piece):
         self._board[row][col] = piece
-        self._refresh()
+        self._refresh_cell(row, col)
         if self._on_change:
             self._on_change(self._board)
 
 
 # ── Dialog Step Editor ─────────────────────────────────────────────────────────
 
+DIALOG_FIELDS = (("speaker", "(narrator)"), ("portrait", "(none)"), ("text", ""))
+
+
+class DialogLine(GObject.Object):
+    """One speaker/portrait/text line of a dialog step."""
+
+    speaker = GObject.Property(type=str)
+    portrait = GObject.Property(type=str)
+    text = GObject.Property(type=str)
+
+    @classmethod
+    def from_dict(cls, line: dict) -> "DialogLine":
+        return cls(speaker=line.get("speaker"), portrait=line.get("portrait"),
+                   text=line.get("text"))
+
+    def to_dict(self) -> dict:
+        return {"speaker": self.speaker, "portrait": self.portrait, "text": self.text}
+
+
+class _DialogLineRow(Gtk.Box):
+    """Recycled ListView row: three labelled entries bound to one DialogLine."""
+
+    def __init__(self, on_change):
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        self._on_change = on_change
+        self._line: DialogLine | None = None
+        self._entries: list[tuple[Gtk.Entry, str, int]] = []
+
+        self.set_margin_start(8)
+        self.set_margin_end(8)
+        self.set_margin_top(8)
+        self.set_margin_bottom(8)
+
+        for key, placeholder in DIALOG_FIELDS:
+            hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+            lbl = Gtk.Label(label=f"{key.capitalize()}:")
+            lbl.set_size_request(72, -1)
+            lbl.set_xalign(1.0)
+            entry = Gtk.Entry()
+            entry.set_placeholder_text(placeholder)
+            entry.set_hexpand(True)
+            handler_id = entry.connect("changed", self._on_field_changed, key)
+            self._entries.append((entry, key, handler_id))
+            hbox.append(lbl)
+            hbox.append(entry)
+            self.append(hbox)
+
+    def bind(self, line: DialogLine):
+        self._line = line
+        # Filling the entries is not an edit, so keep "changed" quiet
+        for entry, key, handler_id in self._entries:
+            entry.handler_block(handler_id)
+            entry.set_text(line.get_property(key) or "")
+            entry.handler_unblock(handler_id)
+
+    def unbind(self):
+        self._line = None
+
+    def _on_field_changed(self, entry, key: str):
+        if self._line is None:
+            return
+        self._line.set_property(key, entry.get_text().strip() or None)
+        if self._on_change:
+            self._on_change()
+
+
 class DialogEditor(Gtk.Box):
     """Editor for a 'dialog' step (list of speaker/portrait/text lines)."""
 
     def __init__(self, on_change=None):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=8)
         self._on_change = on_change
-        self._lines: list[dict] = []
+        self._store = Gio.ListStore.new(DialogLine)
+        # Edited since set_step() / the last get_step_data()
+        self.dirty = False
 
         self.set_margin_start(12)
         self.set_margin_end(12)
@@ -268,12 +548,22 @@ class DialogEditor(Gtk.Box):
         hdr.set_xalign(0)
         self.append(hdr)
 
+        # ListView only realizes the rows on screen and recycles them on scroll
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_row_setup)
+        factory.connect("bind", self._on_row_bind)
+        factory.connect("unbind", self._on_row_unbind)
+
+        self._selection = Gtk.SingleSelection.new(self._store)
+        self._selection.set_autoselect(False)
+        self._selection.set_can_unselect(True)
+
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_vexpand(True)
-        self._list_box = Gtk.ListBox()
-        self._list_box.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self._list_box.add_css_class("boxed-list")
-        scrolled.set_child(self._list_box)
+        list_view = Gtk.ListView.new(self._selection, factory)
+        list_view.set_show_separators(True)
+        list_view.add_css_class("boxed-list")
+        scrolled.set_child(list_view)
         self.append(scrolled)
 
         btn_bar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -287,72 +577,40 @@ class DialogEditor(Gtk.Box):
         self.append(btn_bar)
 
     def set_step(self, step):
-        self._lines = copy.deepcopy(step.get("lines", []))
-        self._rebuild()
+        lines = [DialogLine.from_dict(line) for line in step.get("lines", [])]
+        self._store.splice(0, self._store.get_n_items(), lines)
+        self.dirty = False
 
     def get_step_data(self) -> dict:
-        return {"type": "dialog", "lines": copy.deepcopy(self._lines)}
+        self.dirty = False
+        return {"type": "dialog", "lines": [line.to_dict() for line in self._store]}
 
     # ── Private ──────────────────────────────────────────────────────
 
-    def _rebuild(self):
-        while True:
-            row = self._list_box.get_row_at_index(0)
-            if row is None:
-                break
-            self._list_box.remove(row)
-
-        for i, line in enumerate(self._lines):
-            self._list_box.append(self._make_row(i, line))
-
-    def _make_row(self, idx: int, line: dict) -> Gtk.ListBoxRow:
-        row = Gtk.ListBoxRow()
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        box.set_margin_start(8)
-        box.set_margin_end(8)
-        box.set_margin_top(8)
-        box.set_margin_bottom(8)
-        row.set_child(box)
-
-        for key, placeholder in [("speaker", "(narrator)"), ("portrait", "(none)"), ("text", "")]:
-            hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-            lbl = Gtk.Label(label=f"{key.capitalize()}:")
-            lbl.set_size_request(72, -1)
-            lbl.set_xalign(1.0)
-            entry = Gtk.Entry()
-            entry.set_text(line.get(key) or "")
-            entry.set_placeholder_text(placeholder)
-            entry.set_hexpand(True)
-            entry.connect("changed", self._on_field_changed, idx, key)
-            hbox.append(lbl)
-            hbox.append(entry)
-            box.append(hbox)
+    def _on_row_setup(self, _factory, list_item):
+        list_item.set_child(_DialogLineRow(self._changed))
 
-        return row
+    def _on_row_bind(self, _factory, list_item):
+        list_item.get_child().bind(list_item.get_item())
 
-    def _on_field_changed(self, entry, idx: int, key: str):
-        if idx < len(self._lines):
-            val = entry.get_text().strip() or None
-            self._lines[idx][key] = val
-            if self._on_change:
-                self._on_change()
+    def _on_row_unbind(self, _factory, list_item):
+        list_item.get_child().unbind()
 
     def _add_line(self, _btn):
-        self._lines.append({"speaker": None, "portrait": None, "text": ""})
-        self._rebuild()
-        if self._on_change:
-            self._on_change()
+        self._store.append(DialogLine(speaker=None, portrait=None, text=""))
+        self._changed()
 
     def _delete_line(self, _btn):
-        row = self._list_box.get_selected_row()
-        if row is None:
+        pos = self._selection.get_selected()
+        if pos == Gtk.INVALID_LIST_POSITION:
             return
-        idx = row.get_index()
-        if 0 <= idx < len(self._lines):
-            del self._lines[idx]
-            self._rebuild()
-            if self._on_change:
-                self._on_change()
+        self._store.remove(pos)
+        self._changed()
+
+    def _changed(self):
+        self.dirty = True
+        if self._on_change:
+            self._on_change()
 
 
 # ── Puzzle Step Editor ─────────────────────────────────────────────────────────
@@ -363,7 +621,12 @@ class PuzzleEditor(Gtk.Box):
     def __init__(self, on_change=None):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         self._on_change = on_change
-        self._loading = False
+        # Edited since set_step() / the last get_step_data()
+        self.dirty = False
+        # (widget, handler id) of every field signal, blocked while set_step() fills them
+        self._field_handlers: list[tuple[GObject.Object, int]] = []
+        # Keystrokes are coalesced into one on_change per 100ms
+        self._pending_notify_id = 0
 
         self.set_margin_start(16)
         self.set_margin_end(16)
@@ -409,65 +672,70 @@ class PuzzleEditor(Gtk.Box):
             return box
 
         self._id_entry = Gtk.Entry()
-        self._id_entry.connect("changed", lambda _e: self._notify())
+        self._watch_field(self._id_entry, "changed")
         meta_col.append(row("ID:", self._id_entry))
 
         self._title_entry = Gtk.Entry()
-        self._title_entry.connect("changed", lambda _e: self._notify())
+        self._watch_field(self._title_entry, "changed")
         meta_col.append(row("Title:", self._title_entry))
 
         self._desc_entry = Gtk.Entry()
-        self._desc_entry.connect("changed", lambda _e: self._notify())
+        self._watch_field(self._desc_entry, "changed")
         meta_col.append(row("Description:", self._desc_entry))
 
         self._hint_entry = Gtk.Entry()
-        self._hint_entry.connect("changed", lambda _e: self._notify())
+        self._watch_field(self._hint_entry, "changed")
         meta_col.append(row("Hint:", self._hint_entry))
 
         self._player_combo = Gtk.DropDown.new_from_strings(PLAYERS)
-        self._player_combo.connect("notify::selected", lambda _dd, _p: self._notify())
+        self._watch_field(self._player_combo, "notify::selected")
         meta_col.append(row("Player:", self._player_combo))
 
         self._win_combo = Gtk.DropDown.new_from_strings(WIN_CONDITIONS)
-        self._win_combo.connect("notify::selected", lambda _dd, _p: self._notify())
+        self._watch_field(self._win_combo, "notify::selected")
         meta_col.append(row("Win Condition:", self._win_combo))
 
         adj = Gtk.Adjustment(value=1, lower=1, upper=20, step_increment=1)
         self._max_moves_spin = Gtk.SpinButton(adjustment=adj)
-        self._max_moves_spin.connect("value-changed", lambda _s: self._notify())
+        self._watch_field(self._max_moves_spin, "value-changed")
         meta_col.append(row("Max Moves:", self._max_moves_spin))
 
         self._opp_entry = Gtk.Entry()
         self._opp_entry.set_placeholder_text("e.g. Kd1, Kd2  (comma-separated)")
-        self._opp_entry.connect("changed", lambda _e: self._notify())
+        self._watch_field(self._opp_entry, "changed")
         meta_col.append(row("Opp. Moves:", self._opp_entry))
 
     def set_step(self, step: dict):
-        self._loading = True
-
-        self._id_entry.set_text(step.get("id", ""))
-        self._title_entry.set_text(step.get("title", ""))
-        self._desc_entry.set_text(step.get("description", ""))
-        self._hint_entry.set_text(step.get("hint", ""))
-
-        player = step.get("player", "white")
-        self._player_combo.set_selected(PLAYERS.index(player) if player in PLAYERS else 0)
+        # Anything still pending belongs to the step being replaced; _flush()
+        # has already reported it if it was going to be kept
+        self._cancel_notify()
+        for widget, handler_id in self._field_handlers:
+            widget.handler_block(handler_id)
+        try:
+            self._id_entry.set_text(step.get("id", ""))
+            self._title_entry.set_text(step.get("title", ""))
+            self._desc_entry.set_text(step.get("description", ""))
+            self._hint_entry.set_text(step.get("hint", ""))
 
-        wc = step.get("win_condition", {})
-        wc_type = wc.get("type", "capture_chief")
-        self._win_combo.set_selected(
-            WIN_CONDITIONS.index(wc_type) if wc_type in WIN_CONDITIONS else 0
-        )
-        self._max_moves_spin.set_value(wc.get("max_moves", 1))
+            player = step.get("player", "white")
+            self._player_combo.set_selected(_PLAYER_IDX.get(player, 0))
 
-        opp_moves = step.get("opponent_moves", [])
-        self._opp_entry.set_text(", ".join(opp_moves))
+            wc = step.get("win_condition", {})
+            wc_type = wc.get("type", "capture_chief")
+            self._win_combo.set_selected(_WIN_IDX.get(wc_type, 0))
+            self._max_moves_spin.set_value(wc.get("max_moves", 1))
 
-        self._board_grid.set_board(step.get("board", empty_board()))
+            opp_moves = step.get("opponent_moves", [])
+            self._opp_entry.set_text(", ".join(opp_moves))
 
-        self._loading = False
+            self._board_grid.set_board(step.get("board") or _EMPTY_BOARD)
+        finally:
+            for widget, handler_id in self._field_handlers:
+                widget.handler_unblock(handler_id)
+        self.dirty = False
 
     def get_step_data(self) -> dict:
+        self.dirty = False
         wc_type = WIN_CONDITIONS[self._win_combo.get_selected()]
         opp_text = self._opp_entry.get_text().strip()
         opp_moves = [m.strip() for m in opp_text.split(",") if m.strip()] if opp_text else []
@@ -486,10 +754,54 @@ class PuzzleEditor(Gtk.Box):
             "opponent_moves": opp_moves,
         }
 
-    def _notify(self):
-        if not self._loading and self._on_change:
+    def _watch_field(self, widget: GObject.Object, signal_name: str):
+        handler_id = widget.connect(signal_name, lambda *_args: self._notify())
+        self._field_handlers.append((widget, handler_id))
+
+    def flush_pending_notify(self):
+        """Deliver a debounced on_change now, before the step data is read."""
+        if self._pending_notify_id:
+            self._cancel_notify()
             self._on_change()
 
+    def _notify(self):
+        self.dirty = True
+        if not self._on_change or self._pending_notify_id:
+            return
+        self._pending_notify_id = GLib.timeout_add(100, self._flush_notify)
+
+    def _flush_notify(self) -> bool:
+        self._pending_notify_id = 0
+        self._on_change()
+        return False  # don't repeat
+
+    def _cancel_notify(self):
+        if self._pending_notify_id:
+            GLib.source_remove(self._pending_notify_id)
+            self._pending_notify_id = 0
+
+
+# ── Step List Row ──────────────────────────────────────────────────────────────
+
+class _StepRow(Gtk.ListBoxRow):
+    """Step list row; the label is built once and only its text changes after."""
+
+    def __init__(self, text: str = ""):
+        super().__init__()
+        self._text = text
+        self._label = Gtk.Label(label=text, xalign=0)
+        self._label.set_ellipsize(Pango.EllipsizeMode.END)
+        self._label.set_margin_start(10)
+        self._label.set_margin_end(10)
+        self._label.set_margin_top(6)
+        self._label.set_margin_bottom(6)
+        self.set_child(self._label)
+
+    def set_text(self, text: str):
+        if text != self._text:
+            self._text = text
+            self._label.set_text(text)
+
 
 # ── Main Window ────────────────────────────────────────────────────────────────
 
@@ -501,15 +813,55 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
 
         self._chapter: dict | None = None
         self._filepath: str | None = None
+        self._filepath_resolved: Path | None = None
+        self._basename = ""
+        # Last strings pushed to the header label / window title
+        self._shown_titles: tuple[str, str] | None = None
+        self._title_pending = False
         self._current_idx: int = -1
         self._dirty: bool = False
         self._server_proc: subprocess.Popen | None = None
         self._server_port: int = 8001  # Use 8001 to avoid conflict with 'just serve' on 8000
 
+        # Resolved once; Path.resolve() walks the filesystem on every call
+        self._data_dir_resolved: Path = DATA_DIR.resolve()
+        self._dev_server_path: Path = Path(__file__).resolve().parent / "dev_server.py"
+        # Open file relative to data/ (e.g. "story/chapter_1.json"), None if outside it
+        self._watch_rel: str | None = None
+        # path → ((st_mtime_ns, st_size), chapter) for chapters known to match
+        # the file on disk; dropped as soon as the open chapter is edited
+        self._json_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+        # Shared by the Open and Save As dialogs
+        self._json_filter = Gtk.FileFilter()
+        self._json_filter.set_name("JSON files (*.json)")
+        self._json_filter.add_pattern("*.json")
+        story_dir = DATA_DIR / "story"
+        self._story_gfile = Gio.File.new_for_path(str(story_dir)) if story_dir.exists() else None
+
+        # Saves are written on a single I/O thread so the UI never waits on disk
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-editor-io")
+        self._save_in_flight = False
+        self._save_again = False
+        self._after_save: list[Callable[[], None]] = []
+        # Bumped by every edit; a save only clears _dirty if it still matches
+        self._change_seq = 0
+
+        # $BROWSER wins over the webbrowser module; decided once per window
+        browser_env = os.environ.get("BROWSER")
+        if browser_env:
+            self._browser_open = lambda url: subprocess.Popen(
+                [browser_env, url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+        else:
+            self._browser_open = webbrowser.open
+
         # Native Godot playback (macOS) — set via --native / --godot-path CLI flags
         self._native_mode: bool = getattr(app, "native_mode", False)
         self._godot_path: str = getattr(app, "godot_path", "")
-        self._godot_proc: subprocess.Popen | None = None
+        # Cleared by _on_godot_exit(), so "not None" means Godot is running
+        self._godot_proc: Gio.Subprocess | None = None
+        self._godot_pid: int = 0
 
         self._install_css()
         self._build_ui()
@@ -547,10 +899,10 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
         self._play_btn.set_sensitive(False)
         header.pack_start(self._play_btn)
 
-        save_btn = Gtk.Button(label="Save")
-        save_btn.add_css_class("suggested-action")
-        save_btn.connect("clicked", self._save_file)
-        header.pack_end(save_btn)
+        self._save_btn = Gtk.Button(label="Save")
+        self._save_btn.add_css_class("suggested-action")
+        self._save_btn.connect("clicked", self._save_file)
+        header.pack_end(self._save_btn)
 
         self._header_title = Gtk.Label(label="No file open")
         header.set_title_widget(self._header_title)
@@ -614,18 +966,29 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
         placeholder.add_css_class("dim-label")
         self._stack.add_named(placeholder, "placeholder")
 
-        puzzle_scroll = Gtk.ScrolledWindow()
-        self._puzzle_editor = PuzzleEditor(on_change=self._mark_dirty)
-        puzzle_scroll.set_child(self._puzzle_editor)
-        self._stack.add_named(puzzle_scroll, "puzzle")
-
-        dialog_scroll = Gtk.ScrolledWindow()
-        self._dialog_editor = DialogEditor(on_change=self._mark_dirty)
-        dialog_scroll.set_child(self._dialog_editor)
-        self._stack.add_named(dialog_scroll, "dialog")
+        # The editor pages are built the first time a step of their type is shown
+        self._puzzle_editor: PuzzleEditor | None = None
+        self._dialog_editor: DialogEditor | None = None
 
         paned.set_end_child(self._stack)
 
+    def _get_puzzle_editor(self) -> PuzzleEditor:
+        if self._puzzle_editor is None:
+            self._puzzle_editor = PuzzleEditor(on_change=self._mark_dirty)
+            self._add_editor_page(self._puzzle_editor, "puzzle")
+        return self._puzzle_editor
+
+    def _get_dialog_editor(self) -> DialogEditor:
+        if self._dialog_editor is None:
+            self._dialog_editor = DialogEditor(on_change=self._mark_dirty)
+            self._add_editor_page(self._dialog_editor, "dialog")
+        return self._dialog_editor
+
+    def _add_editor_page(self, editor: Gtk.Widget, name: str):
+        scroll = Gtk.ScrolledWindow()
+        scroll.set_child(editor)
+        self._stack.add_named(scroll, name)
+
     # ── Play in browser ────────────────────────────────────────────────────────
 
     def _play_in_browser(self, _btn=None):
@@ -634,14 +997,11 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
             return
 
         # Save first so the browser sees the latest content
-        self._save_file()
-        if self._dirty:  # save failed
-            return
+        self._save_file(on_saved=self._launch_in_browser)
 
-        # Derive the watch path relative to data/ (e.g. "story/chapter_1.json")
-        try:
-            watch_rel = str(Path(self._filepath).resolve().relative_to(DATA_DIR.resolve()))
-        except ValueError:
+    def _launch_in_browser(self):
+        watch_rel = self._watch_rel
+        if watch_rel is None:
             self._error(
                 f"File is not inside the data directory:\n"
                 f"{self._filepath}\n\n"
@@ -664,14 +1024,17 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
                             puzzle_arg = s.get("id", "")
                             break
 
-        # Kill any existing server (ours or anything else on the port)
+        # Kill any existing server (ours or anything else on the port). Our own
+        # server is stopped by process group, so lsof is only needed for a
+        # stranger, and only when something is actually listening.
+        ours = self._server_proc is not None
         self._kill_server()
-        self._kill_port(self._server_port)
+        if not ours and self._port_in_use(self._server_port):
+            self._kill_port(self._server_port)
 
         # Build the dev server command
-        server_script = Path(__file__).resolve().parent / "dev_server.py"
         cmd = [
-            sys.executable, str(server_script),
+            sys.executable, str(self._dev_server_path),
             str(self._server_port),
             f"--watch={watch_rel}",
         ]
@@ -704,11 +1067,7 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
 
     def _open_browser(self, url: str) -> bool:
         """Open the browser (called from GLib.timeout_add, returns False to not repeat)."""
-        browser_env = os.environ.get("BROWSER")
-        if browser_env:
-            subprocess.Popen([browser_env, url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        else:
-            webbrowser.open(url)
+        self._browser_open(url)
         return False  # don't repeat
 
     def _kill_server(self):
@@ -721,6 +1080,13 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
             self._server_proc = None
             self._play_btn.set_label("▶ Play")
 
+    @staticmethod
+    def _port_in_use(port: int) -> bool:
+        """Cheap check for a listener on localhost before reaching for lsof."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.05)
+            return sock.connect_ex(("127.0.0.1", port)) == 0
+
     @staticmethod
     def _kill_port(port: int):
         """Kill any process listening on the given TCP port."""
@@ -749,22 +1115,19 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
             return
 
         # Always save so Godot sees the latest content
-        self._save_file()
-        if self._dirty:  # save failed
-            return
+        self._save_file(on_saved=self._launch_native)
 
+    def _launch_native(self):
         # If Godot is already running, just saving is enough (hot-reload)
-        if self._godot_proc is not None and self._godot_proc.poll() is None:
+        if self._godot_proc is not None:
             self._play_btn.set_label("▶ Saved")
             # Reset label after a moment
             GLib.timeout_add(800, self._reset_play_label_native)
             self._focus_godot()
             return
 
-        # Derive the watch path relative to data/ (e.g. "story/chapter_1.json")
-        try:
-            watch_rel = str(Path(self._filepath).resolve().relative_to(DATA_DIR.resolve()))
-        except ValueError:
+        watch_rel = self._watch_rel
+        if watch_rel is None:
             self._error(
                 f"File is not inside the data directory:\n"
                 f"{self._filepath}\n\n"
@@ -804,91 +1167,139 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
         print(f"[LevelEditor] Launching Godot: {' '.join(cmd)}")
 
         try:
-            self._godot_proc = subprocess.Popen(
-                cmd,
-                stdout=None,  # Inherit terminal for debug output
-                stderr=None,
-            )
-        except FileNotFoundError:
-            self._error(
-                f"Could not find Godot binary:\n{self._godot_path}\n\n"
-                "Install with: brew install --cask godot\n"
-                "Or set GODOT_PATH to your Godot binary."
-            )
-            return
-        except Exception as exc:
-            self._error(f"Could not launch Godot:\n{exc}")
+            # No pipe flags: stdout/stderr inherit the terminal for debug output
+            proc = Gio.Subprocess.new(cmd, Gio.SubprocessFlags.NONE)
+        except GLib.Error as exc:
+            if exc.matches(GLib.spawn_error_quark(), GLib.SpawnError.NOENT):
+                self._error(
+                    f"Could not find Godot binary:\n{self._godot_path}\n\n"
+                    "Install with: brew install --cask godot\n"
+                    "Or set GODOT_PATH to your Godot binary."
+                )
+            else:
+                self._error(f"Could not launch Godot:\n{exc.message}")
             return
+        self._godot_proc = proc
+        # None if Godot already exited and was reaped (e.g. a bad project path)
+        ident = proc.get_identifier()
+        self._godot_pid = int(ident) if ident is not None else 0
 
         # Update button state
         self._play_btn.set_label("▶ Playing…")
         self._play_btn.set_tooltip_text(
-            f"Godot running (PID {self._godot_proc.pid})\n"
+            f"Godot running (PID {self._godot_pid})\n"
             f"Watching: {watch_rel}"
             + (f"\nPuzzle: {puzzle_arg}" if puzzle_arg else "")
             + "\nClick to save & hot-reload"
         )
 
-        # Give Godot a moment to create its window, then focus it
-        GLib.timeout_add(800, self._focus_godot)
+        # Focus Godot once it has a window; _focus_godot() retries until then
+        GLib.timeout_add(200, self._focus_godot)
 
-        # Poll for Godot exit so we can reset the button
-        GLib.timeout_add(1000, self._poll_godot_proc)
+        # Reset the button when Godot exits; GLib reaps the child for us
+        proc.wait_async(None, self._on_godot_exit)
 
-    @staticmethod
-    def _focus_godot() -> bool:
+    _FOCUS_ATTEMPTS = 10  # × 200ms: how long to wait for Godot's window
+
+    def _focus_godot(self, attempt: int = 0) -> bool:
         """Bring the Godot window to the front (macOS). Returns False for GLib.timeout_add."""
-        if sys.platform == "darwin":
-            try:
-                subprocess.Popen(
-                    ["osascript", "-e",
-                     'tell application "System Events" to set frontmost of '
-                     'first process whose unix id is '
-                     '(do shell script "pgrep -x Godot") to true'],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-            except Exception:
-                pass
+        if sys.platform != "darwin" or self._godot_proc is None or not self._godot_pid:
+            return False
+
+        if NSRunningApplication is not None:
+            # In-process: no osascript to spawn. None until the app registers.
+            app = NSRunningApplication.runningApplicationWithProcessIdentifier_(
+                self._godot_pid
+            )
+            if app is None or not app.activateWithOptions_(NSApplicationActivateIgnoringOtherApps):
+                if attempt + 1 < self._FOCUS_ATTEMPTS:
+                    GLib.timeout_add(200, self._focus_godot, attempt + 1)
+            return False  # don't repeat
+
+        script = (
+            'tell application "System Events" to set frontmost of '
+            f'(first process whose unix id is {self._godot_pid}) to true'
+        )
+        try:
+            osa = Gio.Subprocess.new(
+                ["osascript", "-e", script],
+                Gio.SubprocessFlags.STDOUT_SILENCE | Gio.SubprocessFlags.STDERR_SILENCE,
+            )
+        except GLib.Error:
+            return False
+        if attempt + 1 < self._FOCUS_ATTEMPTS:
+            osa.wait_check_async(None, self._on_focus_done, attempt)
         return False  # don't repeat
 
-    def _poll_godot_proc(self) -> bool:
-        """Check if the Godot process is still running (GLib timeout callback)."""
-        if self._godot_proc is None or self._godot_proc.poll() is not None:
-            self._godot_proc = None
-            self._play_btn.set_label("▶ Play")
-            self._play_btn.set_tooltip_text("Save & play natively (launches Godot)")
-            return False  # stop polling
-        return True  # keep polling
+    def _on_focus_done(self, osa: Gio.Subprocess, result: Gio.AsyncResult, attempt: int):
+        """Gio.Subprocess.wait_check_async callback for osascript."""
+        try:
+            osa.wait_check_finish(result)
+        except GLib.Error:
+            # osascript fails until System Events knows the new process; try again
+            GLib.timeout_add(200, self._focus_godot, attempt + 1)
+
+    def _on_godot_exit(self, proc: Gio.Subprocess, result: Gio.AsyncResult):
+        """Gio.Subprocess.wait_async callback: the Godot process has exited."""
+        try:
+            proc.wait_finish(result)
+        except GLib.Error:
+            pass
+        # Ignore the exit of a Godot we already killed and replaced
+        if proc is not self._godot_proc:
+            return
+        self._godot_proc = None
+        self._play_btn.set_label("▶ Play")
+        self._play_btn.set_tooltip_text("Save & play natively (launches Godot)")
 
     def _reset_play_label_native(self) -> bool:
         """Reset Play button label after a brief 'Saved' flash."""
-        if self._godot_proc is not None and self._godot_proc.poll() is None:
+        if self._godot_proc is not None:
             self._play_btn.set_label("▶ Playing…")
         else:
             self._play_btn.set_label("▶ Play")
         return False  # don't repeat
 
     def _kill_godot(self):
-        """Kill the Godot subprocess if running."""
-        if self._godot_proc is not None:
+        """Ask Godot to quit, forcing it after 3s if it hasn't.
+
+        Doesn't block: the application is held until Godot is gone, so
+        closing the window still outlives a slow Godot shutdown.
+        """
+        proc = self._godot_proc
+        if proc is None:
+            return
+        self._godot_proc = None
+        self._play_btn.set_label("▶ Play")
+
+        app = self.get_application()
+        app.hold()
+        pending = {"timer": 0}
+
+        def force_exit() -> bool:
+            pending["timer"] = 0
+            proc.force_exit()
+            return False  # don't repeat
+
+        def on_exit(p, result):
             try:
-                self._godot_proc.terminate()
-                self._godot_proc.wait(timeout=3)
-            except (ProcessLookupError, PermissionError):
+                p.wait_finish(result)
+            except GLib.Error:
                 pass
-            except subprocess.TimeoutExpired:
-                try:
-                    self._godot_proc.kill()
-                except (ProcessLookupError, PermissionError):
-                    pass
-            self._godot_proc = None
-            self._play_btn.set_label("▶ Play")
+            if pending["timer"]:
+                GLib.source_remove(pending["timer"])
+            app.release()
+
+        proc.send_signal(signal.SIGTERM)
+        pending["timer"] = GLib.timeout_add(3000, force_exit)
+        proc.wait_async(None, on_exit)
 
     def _on_close_request(self, _window):
         """Clean up server/godot processes when the editor window closes."""
         self._kill_server()
         self._kill_godot()
+        # Let a save that is still in flight reach the disk
+        self._io_pool.shutdown(wait=True)
         return False  # allow the window to close
 
     # ── Public API ────────────────────────────────────────────────────────────
@@ -908,14 +1319,10 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
         dialog.add_button("_Cancel", Gtk.ResponseType.CANCEL)
         dialog.add_button("_Open",   Gtk.ResponseType.ACCEPT)
 
-        filt = Gtk.FileFilter()
-        filt.set_name("JSON files (*.json)")
-        filt.add_pattern("*.json")
-        dialog.add_filter(filt)
+        dialog.add_filter(self._json_filter)
 
-        story_dir = DATA_DIR / "story"
-        if story_dir.exists():
-            dialog.set_current_folder(Gio.File.new_for_path(str(story_dir)))
+        if self._story_gfile is not None:
+            dialog.set_current_folder(self._story_gfile)
 
         dialog.connect("response", self._on_open_response)
         dialog.present()
@@ -927,13 +1334,20 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
 
     def _load_file(self, path: str):
         try:
-            with open(path) as fh:
-                self._chapter = json.load(fh)
+            st = os.stat(path)
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._json_cache.get(path)
+            if cached is not None and cached[0] == key:
+                self._chapter = cached[1]
+            else:
+                with open(path, "rb") as fh:
+                    self._chapter = _json_loads(fh.read())
+                self._json_cache[path] = (key, self._chapter)
         except Exception as exc:
             self._error(f"Could not open file:\n{exc}")
             return
 
-        self._filepath = path
+        self._set_filepath(path)
         self._dirty = False
         self._current_idx = -1
         self._play_btn.set_sensitive(True)
@@ -941,21 +1355,76 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
         self._rebuild_step_list()
         self._stack.set_visible_child_name("placeholder")
 
-    def _save_file(self, _btn=None):
+    def _set_filepath(self, path: str):
+        self._filepath = path
+        self._filepath_resolved = Path(path).resolve()
+        self._basename = Path(path).name
+        try:
+            self._watch_rel = str(self._filepath_resolved.relative_to(self._data_dir_resolved))
+        except ValueError:
+            self._watch_rel = None
+
+    def _save_file(self, _btn=None, on_saved: Callable[[], None] | None = None):
+        """Save the chapter; the write runs on the I/O thread.
+
+        `on_saved` runs on the main loop once everything flushed so far is on
+        disk. It is dropped if the save fails (the error is shown instead).
+        """
         if not self._chapter:
             return
         if not self._filepath:
             self._save_as()
             return
+        if on_saved is not None:
+            self._after_save.append(on_saved)
+        if self._save_in_flight:
+            # Picks up whatever changed since the running save took its snapshot
+            self._save_again = True
+            return
+
         self._flush()
         try:
-            with open(self._filepath, "w") as fh:
-                json.dump(self._chapter, fh, indent=2)
-                fh.write("\n")
-            self._dirty = False
-            self._update_title()
+            data = _json_dumps(self._chapter)
         except Exception as exc:
+            self._after_save.clear()
             self._error(f"Could not save file:\n{exc}")
+            return
+
+        self._save_in_flight = True
+        self._save_btn.set_sensitive(False)
+        future = self._io_pool.submit(_write_atomic, self._filepath_resolved, data)
+        context = (self._chapter, self._filepath, self._change_seq)
+        future.add_done_callback(lambda f: GLib.idle_add(self._on_save_done, f, context))
+
+    def _on_save_done(self, future: Future, context: tuple) -> bool:
+        """Main-loop half of _save_file() (GLib.idle_add callback)."""
+        chapter, key, change_seq = context
+        self._save_in_flight = False
+        self._save_btn.set_sensitive(True)
+
+        exc = future.exception()
+        if exc is not None:
+            self._save_again = False
+            self._after_save.clear()
+            self._error(f"Could not save file:\n{exc}")
+            return False
+
+        # Clean only if nothing was edited (or loaded) while the write ran
+        if chapter is self._chapter and change_seq == self._change_seq:
+            st = future.result()
+            self._json_cache[key] = ((st.st_mtime_ns, st.st_size), chapter)
+            self._dirty = False
+            self._update_title()
+
+        if self._save_again:
+            self._save_again = False
+            self._save_file()
+            return False
+
+        callbacks, self._after_save = self._after_save, []
+        for callback in callbacks:
+            callback()
+        return False  # don't repeat
 
     def _save_as(self):
         dialog = Gtk.FileChooserDialog(
@@ -966,79 +1435,93 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
         dialog.add_button("_Cancel", Gtk.ResponseType.CANCEL)
         dialog.add_button("_Save",   Gtk.ResponseType.ACCEPT)
 
-        filt = Gtk.FileFilter()
-        filt.set_name("JSON files (*.json)")
-        filt.add_pattern("*.json")
-        dialog.add_filter(filt)
+        dialog.add_filter(self._json_filter)
 
         if self._filepath:
-            dialog.set_current_name(Path(self._filepath).name)
+            dialog.set_current_name(self._basename)
 
-        def on_response(d, r):
-            if r == Gtk.ResponseType.ACCEPT:
-                self._filepath = d.get_file().get_path()
-                self._save_file()
-            d.destroy()
-
-        dialog.connect("response", on_response)
+        dialog.connect("response", self._on_save_as_response)
         dialog.present()
 
+    def _on_save_as_response(self, dialog, response):
+        if response == Gtk.ResponseType.ACCEPT:
+            self._set_filepath(dialog.get_file().get_path())
+            self._save_file()
+        dialog.destroy()
+
     # ── Step list ─────────────────────────────────────────────────────────────
 
-    def _rebuild_step_list(self, keep_selection: bool = False):
-        while True:
-            row = self._step_list.get_row_at_index(0)
-            if row is None:
-                break
-            self._step_list.remove(row)
+    def _rebuild_step_list(self):
+        """Replace every row; only needed when a different chapter is loaded."""
+        if hasattr(self._step_list, "remove_all"):  # GTK 4.12+
+            self._step_list.remove_all()
+        else:
+            while True:
+                row = self._step_list.get_row_at_index(0)
+                if row is None:
+                    break
+                self._step_list.remove(row)
 
-        if not self._chapter:
-            return
+        for label in self._step_labels():
+            self._step_list.append(_StepRow(label))
+
+    def _relabel_steps(self):
+        """Bring row texts in line with the steps after an insert/delete/move.
 
+        Numbered fallback labels ("Dialog 3", "p04") depend on position, so
+        every row is checked, but only rows whose text changed are touched.
+        """
+        for idx, label in enumerate(self._step_labels()):
+            row = self._step_list.get_row_at_index(idx)
+            if row is not None:
+                row.set_text(label)
+
+    def _step_labels(self) -> list[str]:
+        if not self._chapter:
+            return []
+        labels = []
+        append = labels.append
         dialog_n = puzzle_n = 0
-        for step in self._chapter.get("steps", []):
+        for step in self._chapter.get("steps", ()):
             stype = step.get("type")
             if stype == "dialog":
                 dialog_n += 1
-                lines = step.get("lines", [])
+                lines = step.get("lines")
                 if lines:
                     first = lines[0]
-                    spkr = first.get("speaker") or "—"
                     txt = first.get("text", "")
-                    short = txt[:35] + ("…" if len(txt) > 35 else "")
-                    label = f"💬  {spkr}: {short}"
+                    # "…"[:True] is "…", "…"[:False] is ""
+                    append(f"💬  {first.get('speaker') or '—'}: {txt[:35]}{'…'[:len(txt) > 35]}")
                 else:
-                    label = f"💬  Dialog {dialog_n}"
+                    append(f"💬  Dialog {dialog_n}")
             elif stype == "puzzle":
                 puzzle_n += 1
                 pid = step.get("id", f"p{puzzle_n:02d}")
-                title = step.get("title", "")
-                label = f"♟  {pid}" + (f": {title}" if title else "")
+                title = step.get("title")
+                append(f"♟  {pid}: {title}" if title else f"♟  {pid}")
             else:
-                label = f"?  {stype}"
-
-            list_row = Gtk.ListBoxRow()
-            lbl = Gtk.Label(label=label, xalign=0)
-            lbl.set_ellipsize(Pango.EllipsizeMode.END)
-            lbl.set_margin_start(10)
-            lbl.set_margin_end(10)
-            lbl.set_margin_top(6)
-            lbl.set_margin_bottom(6)
-            list_row.set_child(lbl)
-            self._step_list.append(list_row)
-
-        if keep_selection and 0 <= self._current_idx:
-            steps = self._chapter.get("steps", [])
-            idx = min(self._current_idx, len(steps) - 1)
-            row = self._step_list.get_row_at_index(idx)
-            if row:
-                self._step_list.select_row(row)
+                append(f"?  {stype}")
+        return labels
+
+    def _select_step(self, idx: int):
+        """Select row `idx`; _on_row_selected() then shows that step.
+
+        Callers reset _current_idx to -1 first: the editors still hold the
+        step that was removed or already flushed, and must not be flushed
+        over whichever step now sits at the old index.
+        """
+        row = self._step_list.get_row_at_index(idx)
+        if row is not None:
+            self._step_list.select_row(row)
 
     def _on_row_selected(self, _listbox, row):
         if row is None:
             return
+        idx = row.get_index()
+        if idx == self._current_idx:
+            return  # already showing this step (e.g. after _move_step)
         self._flush()
-        self._current_idx = row.get_index()
+        self._current_idx = idx
         steps = self._chapter.get("steps", [])
         if 0 <= self._current_idx < len(steps):
             self._show_step(steps[self._current_idx])
@@ -1046,26 +1529,34 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
     def _show_step(self, step: dict):
         stype = step.get("type")
         if stype == "puzzle":
-            self._puzzle_editor.set_step(step)
+            self._get_puzzle_editor().set_step(step)
             self._stack.set_visible_child_name("puzzle")
         elif stype == "dialog":
-            self._dialog_editor.set_step(step)
+            self._get_dialog_editor().set_step(step)
             self._stack.set_visible_child_name("dialog")
         else:
             self._stack.set_visible_child_name("placeholder")
 
     def _flush(self):
         """Flush the active editor back into self._chapter."""
+        if self._puzzle_editor is not None:
+            self._puzzle_editor.flush_pending_notify()
         if self._current_idx < 0 or not self._chapter:
             return
         steps = self._chapter.get("steps", [])
         if self._current_idx >= len(steps):
             return
         stype = steps[self._current_idx].get("type")
+        # Skip editors that were never built or have not changed since the
+        # step was loaded into them (or last flushed)
         if stype == "puzzle":
-            steps[self._current_idx] = self._puzzle_editor.get_step_data()
+            editor = self._puzzle_editor
         elif stype == "dialog":
-            steps[self._current_idx] = self._dialog_editor.get_step_data()
+            editor = self._dialog_editor
+        else:
+            return
+        if editor is not None and editor.dirty:
+            steps[self._current_idx] = editor.get_step_data()
 
     # ── Step management ───────────────────────────────────────────────────────
 
@@ -1097,9 +1588,10 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
             }
 
         steps.insert(insert_at, new_step)
-        self._current_idx = insert_at
-        self._rebuild_step_list(keep_selection=True)
-        self._show_step(new_step)
+        self._step_list.insert(_StepRow(), insert_at)
+        self._relabel_steps()
+        self._current_idx = -1
+        self._select_step(insert_at)
         self._mark_dirty()
 
     def _delete_step(self, _btn):
@@ -1109,10 +1601,14 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
         if not steps or self._current_idx >= len(steps):
             return
         del steps[self._current_idx]
-        self._current_idx = min(self._current_idx, len(steps) - 1)
-        self._rebuild_step_list(keep_selection=True)
-        if self._current_idx >= 0:
-            self._show_step(steps[self._current_idx])
+        row = self._step_list.get_row_at_index(self._current_idx)
+        if row is not None:
+            self._step_list.remove(row)
+        self._relabel_steps()
+        new_idx = min(self._current_idx, len(steps) - 1)
+        self._current_idx = -1
+        if new_idx >= 0:
+            self._select_step(new_idx)
         else:
             self._stack.set_visible_child_name("placeholder")
         self._mark_dirty()
@@ -1126,29 +1622,49 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
         if not (0 <= new_idx < len(steps)):
             return
         steps[self._current_idx], steps[new_idx] = steps[new_idx], steps[self._current_idx]
+        # Move the selected row itself; the editors already hold this step,
+        # so reselecting it at new_idx must not reload them
+        row = self._step_list.get_row_at_index(self._current_idx)
+        self._step_list.remove(row)
+        self._step_list.insert(row, new_idx)
+        self._relabel_steps()
         self._current_idx = new_idx
-        self._rebuild_step_list(keep_selection=True)
+        self._step_list.select_row(row)
         self._mark_dirty()
 
     # ── Helpers ───────────────────────────────────────────────────────────────
 
     def _mark_dirty(self):
+        self._change_seq += 1
+        # The open chapter no longer matches the file it was loaded from
+        if self._filepath:
+            self._json_cache.pop(self._filepath, None)
         if not self._dirty:
             self._dirty = True
-            self._update_title()
+            # Show the dirty marker from the main loop, once per burst of edits
+            if not self._title_pending:
+                self._title_pending = True
+                GLib.idle_add(self._flush_title_update)
+
+    def _flush_title_update(self) -> bool:
+        self._title_pending = False
+        self._update_title()
+        return False  # don't repeat
 
     def _update_title(self):
         if self._chapter and self._filepath:
-            name = Path(self._filepath).name
-            chapter_title = self._chapter.get("title", name)
+            name = self._basename
             dirty_marker = " •" if self._dirty else ""
-            self._header_title.set_label(f"{chapter_title}{dirty_marker}")
-            self.set_title(
-                f"Wachesaw Level Editor — {name}{dirty_marker}"
+            titles = (
+                f"{self._chapter.get('title', name)}{dirty_marker}",
+                f"Wachesaw Level Editor — {name}{dirty_marker}",
             )
         else:
-            self._header_title.set_label("No file open")
-            self.set_title("Wachesaw Level Editor")
+            titles = ("No file open", "Wachesaw Level Editor")
+        if titles != self._shown_titles:
+            self._shown_titles = titles
+            self._header_title.set_label(titles[0])
+            self.set_title(titles[1])
 
     def _error(self, message: str):
         dialog = Gtk.MessageDialog(
@@ -1158,9 +1674,12 @@ class LevelEditorWindow(Gtk.ApplicationWindow):
             buttons=Gtk.ButtonsType.OK,
             text=message,
         )
-        dialog.connect("response", lambda d, _r: d.destroy())
+        dialog.connect("response", self._on_error_response)
         dialog.present()
 
+    def _on_error_response(self, dialog, _response):
+        dialog.destroy()
+
 
 # ── Application ────────────────────────────────────────────────────────────────
 
@@ -1186,55 +1705,18 @@ class LevelEditorApp(Gtk.Application):
         self.activate()
 
 
-def _find_godot_binary() -> str:
-    """Try to locate the Godot 4.4 binary on macOS."""
-    candidates = [
-        "/Applications/Godot_v4.4.app/Contents/MacOS/Godot",
-        "/Applications/Godot.app/Contents/MacOS/Godot",
-    ]
-    for path in candidates:
-        if os.path.isfile(path) and os.access(path, os.X_OK):
-            return path
-    # Fall back to PATH lookup
-    import shutil
-    found = shutil.which("godot")
-    return found or ""
-
-
 def main():
-    app = LevelEditorApp()
+    args = _ARGS if _ARGS is not None else _parse_args(sys.argv)
 
-    # Parse our custom flags before passing to GTK
-    args = sys.argv[:]
-    custom_flags = []
-    for a in args[1:]:
-        if a == "--native":
-            app.native_mode = True
-            custom_flags.append(a)
-        elif a.startswith("--godot-path="):
-            app.godot_path = a.split("=", 1)[1]
-            custom_flags.append(a)
+    # The ngl renderer is GTK's fast GL path; an explicit GSK_RENDERER still wins.
+    # Set before the first window is realized, and inherited by child processes.
+    os.environ.setdefault("GSK_RENDERER", "ngl")
 
-    # Auto-detect godot binary if --native but no --godot-path
-    if app.native_mode and not app.godot_path:
-        app.godot_path = _find_godot_binary()
-        if not app.godot_path:
-            print("Error: --native requires Godot. Install with: brew install --cask godot")
-            print("Or pass --godot-path=/path/to/godot")
-            sys.exit(1)
-
-    # Strip custom flags so GTK doesn't see them
-    args = [a for a in args if a not in custom_flags]
-
-    # Accept an optional file path as the first non-flag argument
-    # (strip it from argv so GTK doesn't stumble on it)
-    non_flags = [a for a in args[1:] if not a.startswith("-")]
-    if non_flags:
-        candidate = Path(non_flags[0])
-        app.initial_file = str(candidate.resolve())
-        args = [a for a in args if a != non_flags[0]]
-
-    sys.exit(app.run(args))
+    app = LevelEditorApp()
+    app.native_mode = args.native_mode
+    app.godot_path = args.godot_path
+    app.initial_file = args.initial_file
+    sys.exit(app.run(args.gtk_args))
 
 
 if __name__ == "__main__":